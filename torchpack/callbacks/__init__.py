@@ -1,6 +1,7 @@
 from .callback import *
 from .checkpoint import *
 from .inference import *
+from .memory import *
 from .metainfo import *
 from .metrics import *
 from .progress import *
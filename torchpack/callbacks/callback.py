@@ -1,5 +1,5 @@
 import traceback
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from torchpack import distributed as dist
 from torchpack.utils.typing import Trainer
@@ -273,47 +273,69 @@ class Callbacks(Callback):
     def __init__(self, callbacks: List[Callback]) -> None:
         for callback in callbacks:
             assert isinstance(callback, Callback), type(callback)
-        self.callbacks = callbacks
+        self.callbacks = tuple(callbacks)
+
+        # pre-bind all hooks to save the attribute lookups on every call, and
+        # skip the callbacks which override neither `hook` nor `_hook`; this is
+        # done here (not in `set_trainer`) so that `after_train` still reaches
+        # every callback even if one of them fails in `set_trainer`
+        def overrides(callback: Callback, hook: str) -> bool:
+            return getattr(type(callback), hook) is not getattr(Callback, hook)
+
+        def bind(hook: str) -> Tuple[Callable, ...]:
+            return tuple(
+                getattr(c, hook) for c in self.callbacks
+                if overrides(c, hook) or overrides(c, '_' + hook))
+
+        self._before_train_fns = bind('before_train')
+        self._before_epoch_fns = bind('before_epoch')
+        self._before_step_fns = bind('before_step')
+        self._after_step_fns = bind('after_step')
+        self._trigger_step_fns = bind('trigger_step')
+        self._after_epoch_fns = bind('after_epoch')
+        self._trigger_epoch_fns = bind('trigger_epoch')
+        self._trigger_fns = bind('trigger')
+        self._after_train_fns = bind('after_train')
 
     def _set_trainer(self, trainer: Trainer) -> None:
         for callback in self.callbacks:
             callback.set_trainer(trainer)
 
     def _before_train(self) -> None:
-        for callback in self.callbacks:
-            callback.before_train()
+        for fn in self._before_train_fns:
+            fn()
 
     def _before_epoch(self) -> None:
-        for callback in self.callbacks:
-            callback.before_epoch()
+        for fn in self._before_epoch_fns:
+            fn()
 
     def _before_step(self, feed_dict: Dict[str, Any]) -> None:
-        for callback in self.callbacks:
-            callback.before_step(feed_dict)
+        for fn in self._before_step_fns:
+            fn(feed_dict)
 
     def _after_step(self, output_dict: Dict[str, Any]) -> None:
-        for callback in self.callbacks:
-            callback.after_step(output_dict)
+        for fn in self._after_step_fns:
+            fn(output_dict)
 
     def _trigger_step(self) -> None:
-        for callback in self.callbacks:
-            callback.trigger_step()
+        for fn in self._trigger_step_fns:
+            fn()
 
     def _after_epoch(self) -> None:
-        for callback in self.callbacks:
-            callback.after_epoch()
+        for fn in self._after_epoch_fns:
+            fn()
 
     def _trigger_epoch(self) -> None:
-        for callback in self.callbacks:
-            callback.trigger_epoch()
+        for fn in self._trigger_epoch_fns:
+            fn()
 
     def _trigger(self) -> None:
-        for callback in self.callbacks:
-            callback.trigger()
+        for fn in self._trigger_fns:
+            fn()
 
     def _after_train(self) -> None:
-        for callback in self.callbacks:
-            callback.after_train()
+        for fn in self._after_train_fns:
+            fn()
 
     def _state_dict(self) -> Dict[str, Any]:
         state_dict = dict()
@@ -92,7 +92,7 @@ class BestSaver(Callback):
         if self.scalar not in self.trainer.summary[self.split]:
             logger.warning(f"`{self.scalar}` has not been added to `trainer.summary`.")
             return
-        step, value = self.trainer.summary[self.split][self.scalar][-1]
+        step, value = self.trainer.summary[self.split].get_latest(self.scalar)
 
         if self.step is not None and step <= self.step:
             logger.warning(f"`{self.scalar}` has not been updated since last trigger.")
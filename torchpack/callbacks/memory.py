@@ -0,0 +1,23 @@
+import gc
+from typing import Any, Dict
+
+import torch
+
+from torchpack.callbacks.callback import Callback
+
+__all__ = ['GarbageCollector']
+
+
+class GarbageCollector(Callback):
+    """
+    Run the garbage collector (and release the cached CUDA memory) every k steps.
+    """
+    def __init__(self, interval: int) -> None:
+        assert interval >= 1, interval
+        self.interval = interval
+
+    def _after_step(self, output_dict: Dict[str, Any]) -> None:
+        if self.trainer.global_step % self.interval == 0:
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
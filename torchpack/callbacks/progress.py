@@ -28,14 +28,19 @@ class ProgressBar(Callback):
     def _trigger_step(self) -> None:
         texts = []
         for split in self.trainer.summary.keys():
-            for name in sorted(self.trainer.summary[split].keys()):
-                step, scalar = self.trainer.summary[split][name][-1]
-                if self.matcher.match(name) and step == self.trainer.global_step and \
+            names = [
+                name for name in self.trainer.summary[split].keys()
+                if self.matcher.match(name)
+            ]
+            for name in sorted(names):
+                step, scalar = self.trainer.summary[split].get_latest(name)
+                if step == self.trainer.global_step and \
                         isinstance(scalar, (int, float)):
-                    texts.append('[{}/{}] = {:.3g}'.format(split, name, scalar))
+                    texts.append(f'[{split}/{name}] = {scalar:.3g}')
         if texts:
             self.pbar.set_description(', '.join(texts))
-        self.pbar.update()
+        # `trigger_step` might be skipped by the trainer's `writer_period`
+        self.pbar.update(self.trainer.local_step - self.pbar.n)
 
     def _after_epoch(self) -> None:
         self.pbar.close()
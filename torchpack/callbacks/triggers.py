@@ -5,6 +5,36 @@ from torchpack.callbacks.callback import Callback, ProxyCallback
 __all__ = ['EnableCallbackIf', 'PeriodicTrigger', 'PeriodicCallback']
 
 
+class _StepWindow(Callback):
+    """
+    Track the global step of the last `trigger_step` to check for `every_k_steps`,
+    since the trainer might skip `trigger_step` on some steps (`writer_period`).
+    """
+    every_k_steps: Optional[int]
+
+    def _before_train(self) -> None:
+        self.last_step = self.trainer.global_step
+        super()._before_train()
+
+    def _before_epoch(self) -> None:
+        self.last_step = self.trainer.global_step
+        super()._before_epoch()
+
+    def trigger_step(self) -> None:
+        super().trigger_step()
+        self.last_step = self.trainer.global_step
+
+    def _passed_k_steps(self) -> bool:
+        """
+        Whether the current step is a multiple of `every_k_steps`, or a multiple
+        has been passed since the last `trigger_step`.
+        """
+        if self.every_k_steps is None:
+            return False
+        step, k = self.trainer.global_step, self.every_k_steps
+        return step % k == 0 or step // k > self.last_step // k
+
+
 class EnableCallbackIf(ProxyCallback):
     """
     Enable the callback only if some condition holds.
@@ -42,7 +72,7 @@ class EnableCallbackIf(ProxyCallback):
         return 'EnableCallbackIf-' + str(self.callback)
 
 
-class PeriodicTrigger(ProxyCallback):
+class PeriodicTrigger(_StepWindow, ProxyCallback):
     """
     Trigger the callback every k steps or every k epochs.
     """
@@ -58,7 +88,7 @@ class PeriodicTrigger(ProxyCallback):
         self.every_k_steps = every_k_steps
 
     def _trigger_step(self) -> None:
-        if self.every_k_steps is not None and self.trainer.global_step % self.every_k_steps == 0:
+        if self._passed_k_steps():
             super()._trigger()
 
     def _trigger_epoch(self) -> None:
@@ -69,7 +99,7 @@ class PeriodicTrigger(ProxyCallback):
         return 'PeriodicTrigger-' + str(self.callback)
 
 
-class PeriodicCallback(EnableCallbackIf):
+class PeriodicCallback(_StepWindow, EnableCallbackIf):
     """
     Enable the callback every k steps or every k epochs.
     Note that this can only make a callback less frequent.
@@ -87,9 +117,7 @@ class PeriodicCallback(EnableCallbackIf):
         def predicate(self) -> bool:
             if self.every_k_epochs is not None and self.trainer.epoch_num % self.every_k_epochs == 0:
                 return True
-            if self.every_k_steps is not None and self.trainer.global_step % self.every_k_steps == 0:
-                return True
-            return False
+            return self._passed_k_steps()
 
         super().__init__(callback, predicate)
 
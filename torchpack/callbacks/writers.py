@@ -1,6 +1,10 @@
 import json
+import math
 import os
-from typing import List, Optional, Union
+import threading
+from collections import defaultdict
+from queue import Queue
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -13,6 +17,24 @@ from .callback import Callback
 
 __all__ = ['SummaryWriter', 'ConsoleWriter', 'TFEventWriter', 'JSONLWriter']
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Dict[str, Any]) -> bytes:
+    # orjson writes NaN/Inf as `null` and rejects integers beyond 64 bits, so
+    # such records go through `json` to keep the values identical either way
+    # (only the whitespace and float notation may differ between encoders)
+    if orjson is not None and all(
+            not isinstance(v, float) or math.isfinite(v) for v in obj.values()):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(obj) + '\n').encode()
+
 
 class SummaryWriter(Callback):
     """
@@ -52,12 +74,15 @@ class ConsoleWriter(SummaryWriter):
         self._trigger()
 
     def _trigger(self) -> None:
-        texts = []
-        for name, scalar in sorted(self.scalars.items()):
-            if self.matcher.match(name):
-                texts.append('[{}] = {:.5g}'.format(name, scalar))
-        if texts:
-            logger.info('\n+ '.join([''] + texts))
+        if not self.scalars:
+            return
+
+        # filter before sorting so that only the matched names are sorted
+        names = [name for name in self.scalars if self.matcher.match(name)]
+        if names:
+            names.sort()
+            texts = [f'[{name}] = {self.scalars[name]:.5g}' for name in names]
+            logger.info('\n+ ' + '\n+ '.join(texts))
         self.scalars.clear()
 
 
@@ -65,25 +90,78 @@ class TFEventWriter(SummaryWriter):
     """
     Write summaries to TensorFlow event file.
     """
-    def __init__(self, *, save_dir: Optional[str] = None, split: str = None) -> None:
+    def __init__(self,
+                 *,
+                 save_dir: Optional[str] = None,
+                 split: str = None,
+                 image_interval: int = 1,
+                 flush_secs: int = 120,
+                 flush_on_trigger: bool = False) -> None:
         if save_dir is None:
             save_dir = os.path.join(get_run_dir(), 'tensorboard')
         if split is not None:
             save_dir = os.path.join(save_dir, split)
         self.save_dir = fs.normpath(save_dir)
         self.split = split
+        assert image_interval >= 1, image_interval
+        self.image_interval = image_interval
+        self.flush_secs = flush_secs
+        self.flush_on_trigger = flush_on_trigger
 
     def _set_trainer(self, trainer: Trainer) -> None:
-        from torch.utils.tensorboard import SummaryWriter
-        self.writer = SummaryWriter(self.save_dir)
+        from tensorboard.compat.proto.summary_pb2 import Summary
+        from torch.utils.tensorboard import SummaryWriter, summary
+        self.writer = SummaryWriter(self.save_dir, flush_secs=self.flush_secs)
+        # NOTE: this relies on the private `SummaryWriter._get_file_writer` to
+        # submit merged summaries, since there is no public API for it
+        self.file_writer = self.writer._get_file_writer()
+        self.summary_fn = Summary
+        self.scalar_fn = summary.scalar
+        self.image_fn = summary.image
+        # summary values are buffered by global step and written in one
+        # merged summary per step once triggered
+        self.values = defaultdict(list)
+        self.in_epoch = False
+
+    def _before_epoch(self) -> None:
+        self.in_epoch = True
+
+    def _after_epoch(self) -> None:
+        self.in_epoch = False
 
     def _add_scalar(self, name: str, scalar: Union[int, float]) -> None:
-        self.writer.add_scalar(name, scalar, self.trainer.global_step)
+        self.values[self.trainer.global_step].extend(
+            self.scalar_fn(name, scalar).value)
 
     def _add_image(self, name: str, tensor: np.ndarray) -> None:
-        self.writer.add_image(name, tensor, self.trainer.global_step)
+        # image encoding is expensive, so images added within an epoch are only
+        # written every `image_interval` steps; images added outside (e.g., in
+        # `trigger_epoch` for evaluation) are always written
+        if not self.in_epoch or \
+                self.trainer.global_step % self.image_interval == 0:
+            self.values[self.trainer.global_step].extend(
+                self.image_fn(name, tensor, dataformats='CHW').value)
+
+    def _write_summaries(self) -> None:
+        for step, values in self.values.items():
+            self.file_writer.add_summary(self.summary_fn(value=values), step)
+        self.values.clear()
+
+    def _trigger_step(self) -> None:
+        self._trigger()
+
+    def _trigger_epoch(self) -> None:
+        self._trigger()
+
+    def _trigger(self) -> None:
+        self._write_summaries()
+        # by default, rely on the background flush every `flush_secs` seconds
+        # to avoid blocking the training loop on disk writes
+        if self.flush_on_trigger:
+            self.writer.flush()
 
     def _after_train(self) -> None:
+        self._write_summaries()
         self.writer.close()
 
 
@@ -91,15 +169,36 @@ class JSONLWriter(SummaryWriter):
     """
     Write scalar summaries to JSONL file.
     """
-    def __init__(self, save_dir: Optional[str] = None) -> None:
+    def __init__(self,
+                 save_dir: Optional[str] = None,
+                 *,
+                 sync: bool = False,
+                 flush_every: int = 1) -> None:
         if save_dir is None:
             save_dir = os.path.join(get_run_dir(), 'summary')
         self.save_dir = fs.normpath(save_dir)
+        self.sync = sync
+        assert flush_every >= 1, flush_every
+        self.flush_every = flush_every
 
     def _set_trainer(self, trainer: Trainer) -> None:
         self.scalars = dict()
+        self.buffer = []
         fs.makedir(self.save_dir)
-        self.file = open(os.path.join(self.save_dir, 'scalars.jsonl'), 'a')
+        self.fpath = os.path.join(self.save_dir, 'scalars.jsonl')
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        # if durability is required, let every write sync its data (where
+        # supported) instead of issuing a separate `fsync` after each flush
+        if self.sync:
+            flags |= getattr(os, 'O_DSYNC', 0)
+        fd = os.open(self.fpath, flags, 0o644)
+        self.file = os.fdopen(fd, 'ab', buffering=1 << 16)
+
+        # serialization and disk writes are offloaded to a background thread
+        self.queue = Queue()
+        self.thread = threading.Thread(target=self._worker, daemon=True)
+        self.thread.start()
 
     def _add_scalar(self, name: str, scalar: Union[int, float]) -> None:
         self.scalars[name] = scalar
@@ -107,8 +206,14 @@ class JSONLWriter(SummaryWriter):
     def _trigger_step(self) -> None:
         self.trigger()
 
+    def _after_epoch(self) -> None:
+        # `trigger_epoch` might be skipped by the trainer's `eval_interval`,
+        # so hand over the partial batch at the end of every epoch
+        self._flush()
+
     def _trigger_epoch(self) -> None:
         self.trigger()
+        self._flush(fsync=True)
 
     def _trigger(self) -> None:
         if self.scalars:
@@ -119,8 +224,35 @@ class JSONLWriter(SummaryWriter):
                 **self.scalars
             }
             self.scalars.clear()
-            self.file.write(json.dumps(summary) + '\n')
-            self.file.flush()
+            self.buffer.append(summary)
+            # summaries are handed over in batches of `flush_every`
+            if len(self.buffer) >= self.flush_every:
+                self._flush()
+
+    def _flush(self, *, fsync: bool = False) -> None:
+        if self.buffer or fsync:
+            self.queue.put((self.buffer, fsync))
+            self.buffer = []
+
+    def _worker(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            summaries, fsync = item
+            try:
+                self.file.write(b''.join(_dumps(s) for s in summaries))
+                # only flush once all pending summaries have been written
+                if fsync or self.queue.empty():
+                    self.file.flush()
+                    if fsync or (self.sync and not hasattr(os, 'O_DSYNC')):
+                        os.fsync(self.file.fileno())
+            except Exception:
+                logger.exception(
+                    f'Error occurred when writing "{self.fpath}".')
 
     def _after_train(self) -> None:
+        self._flush(fsync=True)
+        self.queue.put(None)
+        self.thread.join()
         self.file.close()
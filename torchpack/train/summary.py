@@ -1,3 +1,4 @@
+import sys
 from collections import defaultdict, deque
 from typing import Any, Deque, Iterable, Optional, Tuple, Union
 
@@ -9,10 +10,25 @@ from torchpack.utils.typing import Trainer
 
 __all__ = ['Summary']
 
+_CHANNEL_DIMS = frozenset((1, 3, 4))
+
 
 class Summary:
-    def __init__(self, split: str = None) -> None:
-        self.history = defaultdict(deque)
+    def __init__(self,
+                 split: str = None,
+                 *,
+                 keep_history: bool = False,
+                 history_size: Optional[int] = None) -> None:
+        assert history_size is None or history_size > 0, history_size
+        # bounding the history implies keeping it
+        if history_size is not None:
+            keep_history = True
+        if keep_history:
+            self.history = defaultdict(lambda: deque(maxlen=history_size))
+        else:
+            # only keep the latest `(global_step, value)` of every name
+            self.history = dict()
+        self.keep_history = keep_history
         self.split = split
 
     def set_trainer(self, trainer: Trainer) -> None:
@@ -31,22 +47,23 @@ class Summary:
 
     def add_scalar(self,
                    name: str,
-                   scalar: Union[int, float, np.integer, np.floating],
+                   scalar: Union[int, float, np.number, np.ndarray,
+                                 torch.Tensor],
                    *,
                    max_to_keep: Optional[int] = None) -> None:
-        if isinstance(scalar, np.integer):
-            scalar = int(scalar)
-        if isinstance(scalar, np.floating):
-            scalar = float(scalar)
+        # numpy scalars and 0-d arrays/tensors are all unwrapped by `item`;
+        # note that this forces a device sync for CUDA tensors, so prefer
+        # passing `tensor.detach().cpu()` (or a python number) upstream
+        if hasattr(scalar, 'item'):
+            scalar = scalar.item()
         assert isinstance(scalar, (int, float)), type(scalar)
         self._add_scalar(name, scalar, max_to_keep=max_to_keep)
 
     def _add_scalar(self, name: str, scalar: Union[int, float], *,
                     max_to_keep: Optional[int]) -> None:
-        self.history[name].append((self.trainer.global_step, scalar))
-        while max_to_keep is not None and \
-                len(self.history[name]) > max_to_keep:
-            self.history[name].popleft()
+        # names are looked up repeatedly in dicts downstream
+        name = sys.intern(name)
+        self._add_value(name, scalar, max_to_keep=max_to_keep)
         for writer in self.writers:
             writer.add_scalar(name, scalar)
 
@@ -58,36 +75,67 @@ class Summary:
         if isinstance(tensor, torch.Tensor):
             tensor = tensor.cpu().numpy()
         assert isinstance(tensor, np.ndarray), type(tensor)
-        if tensor.ndim == 2:
-            tensor = tensor[np.newaxis, ...]
-        elif tensor.ndim == 3 and tensor.shape[-1] in [1, 3, 4]:
+        ndim = tensor.ndim
+        if ndim == 2:
+            tensor = tensor[np.newaxis]
+        elif ndim == 3 and tensor.shape[-1] in _CHANNEL_DIMS:
             tensor = tensor.transpose(2, 0, 1)
-        assert tensor.ndim == 3 and tensor.shape[0] in [1, 3, 4], tensor.shape
+        assert tensor.ndim == 3 and tensor.shape[0] in _CHANNEL_DIMS, \
+            tensor.shape
         self._add_image(name, tensor, max_to_keep=max_to_keep)
 
     def _add_image(self, name: str, tensor: np.ndarray, *,
                    max_to_keep: Optional[int]) -> None:
-        self.history[name].append((self.trainer.global_step, tensor))
+        self._add_value(name, tensor, max_to_keep=max_to_keep)
+        for writer in self.writers:
+            writer.add_image(name, tensor)
+
+    def _add_value(self, name: str, value: Any, *,
+                   max_to_keep: Optional[int]) -> None:
+        if not self.keep_history:
+            self.history[name] = (self.trainer.global_step, value)
+            return
+        self.history[name].append((self.trainer.global_step, value))
         while max_to_keep is not None and \
                 len(self.history[name]) > max_to_keep:
             self.history[name].popleft()
-        for writer in self.writers:
-            writer.add_image(name, tensor)
+
+    def get_latest(self, name: str) -> Tuple[int, Any]:
+        # check first so that the `defaultdict` does not insert an empty entry
+        if name not in self.history:
+            raise KeyError(name)
+        if self.keep_history:
+            return self.history[name][-1]
+        return self.history[name]
+
+    def get_history(self, name: str) -> Deque[Tuple[int, Any]]:
+        if not self.keep_history:
+            raise RuntimeError(
+                'History is not kept; construct `Summary(keep_history=True)`.')
+        return self.history[name]
 
     def keys(self) -> Iterable[str]:
         for key in self.history.keys():
             yield key
 
+    def _view(self, key: str) -> Deque[Tuple[int, Any]]:
+        # without history, only the latest value is exposed as a deque
+        if self.keep_history:
+            return self.history[key]
+        if key in self.history:
+            return deque([self.history[key]], maxlen=1)
+        return deque(maxlen=1)
+
     def values(self) -> Iterable[Deque[Tuple[int, Any]]]:
-        for value in self.history.values():
-            yield value
+        for key in self.history.keys():
+            yield self._view(key)
 
     def items(self) -> Iterable[Tuple[str, Deque[Tuple[int, Any]]]]:
-        for key, value in self.history.items():
-            yield key, value
+        for key in self.history.keys():
+            yield key, self._view(key)
 
     def __contains__(self, key: str) -> bool:
         return key in self.history
 
     def __getitem__(self, key: str) -> Deque[Tuple[int, Any]]:
-        return self.history[key]
+        return self._view(key)
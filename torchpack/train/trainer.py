@@ -8,6 +8,7 @@ from torchpack.callbacks import (
     Callbacks,
     ConsoleWriter,
     EstimatedTimeLeft,
+    GarbageCollector,
     JSONLWriter,
     MetaInfoSaver,
     ProgressBar,
@@ -33,7 +34,11 @@ class Trainer:
         num_epochs: int = 9999999,
         eval_interval: int = None,
         splits: List[str] = None,
-        callbacks: Optional[List[Callback]] = None
+        callbacks: Optional[List[Callback]] = None,
+        writer_period: int = 1,
+        keep_history: bool = False,
+        history_size: Optional[int] = None,
+        gc_interval: Optional[int] = None
     ) -> None:
         if callbacks is None:
             callbacks = []
@@ -44,6 +49,8 @@ class Trainer:
             ProgressBar(),
             EstimatedTimeLeft(),
         ]
+        if gc_interval is not None:
+            callbacks.append(GarbageCollector(gc_interval))
         if splits is None:
             callbacks.append(TFEventWriter())
         else:
@@ -55,6 +62,9 @@ class Trainer:
             eval_interval=eval_interval,
             splits=splits,
             callbacks=callbacks,
+            writer_period=writer_period,
+            keep_history=keep_history,
+            history_size=history_size,
         )
 
     def train(
@@ -64,19 +74,47 @@ class Trainer:
         num_epochs: int = 9999999,
         eval_interval: int = None,
         splits: List[str] = None,
-        callbacks: Optional[List[Callback]] = None
+        callbacks: Optional[List[Callback]] = None,
+        writer_period: int = 1,
+        keep_history: bool = False,
+        history_size: Optional[int] = None
     ) -> None:
+        """
+        Note that `trigger_step` is only fired every `writer_period` steps
+        (and always on the last step of an epoch). Scalars added in between
+        are coalesced by name in `JSONLWriter` and `ConsoleWriter`, so the last
+        value wins; `TFEventWriter` (and `Summary` with history) still keeps the
+        values of every step. Step-based triggers (e.g., `PeriodicTrigger`) fire
+        at the first `trigger_step` at or after every `every_k_steps` steps.
+
+        By default, each summary only keeps the latest value of every name
+        (`summary[name]` then only holds that single entry). Set `keep_history`
+        to keep the full history, or `history_size` to keep the latest
+        `history_size` values (which implies `keep_history`).
+        """
+        assert writer_period >= 1, writer_period
         self.dataflow = dataflow
         self.steps_per_epoch = len(self.dataflow)
         self.num_epochs = num_epochs
+        self.writer_period = writer_period
+        self._has_distributed_sampler = isinstance(
+            self.dataflow, DataLoader
+        ) and isinstance(self.dataflow.sampler, DistributedSampler)
 
         if callbacks is None:
             callbacks = []
         self.callbacks = Callbacks(callbacks)
         if splits is None:
-            self.summary = {"0": Summary()}
+            self.summary = {
+                "0": Summary(keep_history=keep_history, history_size=history_size)
+            }
         else:
-            self.summary = {s: Summary(split=s) for s in splits}
+            self.summary = {
+                s: Summary(
+                    split=s, keep_history=keep_history, history_size=history_size
+                )
+                for s in splits
+            }
 
         try:
             self.callbacks.set_trainer(self)
@@ -96,7 +134,7 @@ class Trainer:
                 logger.info(
                     "Epoch {}/{} started.".format(self.epoch_num, self.num_epochs)
                 )
-                epoch_time = time.perf_counter()
+                epoch_time = time.perf_counter_ns()
                 self.before_epoch()
 
                 for feed_dict in self.dataflow:
@@ -107,24 +145,25 @@ class Trainer:
                     output_dict = self.run_step(feed_dict)
                     self.after_step(output_dict)
 
-                    self.trigger_step()
+                    if (
+                        self.local_step % self.writer_period == 0
+                        or self.local_step == self.steps_per_epoch
+                    ):
+                        self.trigger_step()
 
                 self.after_epoch()
-                logger.info(
-                    "Training finished in {}.".format(
-                        humanize.naturaldelta(time.perf_counter() - epoch_time)
-                    )
-                )
 
                 if eval_interval is not None:
                     if self.epoch_num % eval_interval == 0:
                         self.trigger_epoch()
                 else:
                     self.trigger_epoch()
-                logger.info(
-                    "Epoch finished in {}.".format(
-                        humanize.naturaldelta(time.perf_counter() - epoch_time)
-                    )
+
+                # the duration is only humanized if the message is emitted
+                epoch_time = time.perf_counter_ns() - epoch_time
+                logger.opt(lazy=True).info(
+                    "Epoch finished in {}.",
+                    lambda: humanize.naturaldelta(epoch_time / 1e9),
                 )
 
             logger.success(
@@ -146,9 +185,7 @@ class Trainer:
         pass
 
     def before_epoch(self) -> None:
-        if isinstance(self.dataflow, DataLoader) and isinstance(
-            self.dataflow.sampler, DistributedSampler
-        ):
+        if self._has_distributed_sampler:
             self.dataflow.sampler.set_epoch(self.epoch_num)
         self._before_epoch()
         self.callbacks.before_epoch()
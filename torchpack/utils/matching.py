@@ -1,4 +1,6 @@
 import fnmatch
+import os
+import re
 from typing import List, Optional, Union
 
 __all__ = ['NameMatcher']
@@ -12,8 +14,26 @@ class NameMatcher:
             patterns = [patterns]
         self.patterns = patterns
 
+        # fuse all patterns into a single regex so that each name only
+        # needs one `match` call, no matter how many patterns there are
+        if patterns:
+            self.regex = re.compile('|'.join(
+                '(?:' + fnmatch.translate(os.path.normcase(pattern)) + ')'
+                for pattern in patterns))
+        else:
+            self.regex = None
+
+        # the same names are matched over and over again (e.g., every step),
+        # so the results are memoized; patterns are fixed after construction
+        self.cache = dict()
+
     def match(self, name: str) -> bool:
-        for pattern in self.patterns:
-            if fnmatch.fnmatch(name, pattern):
-                return True
-        return False
+        matched = self.cache.get(name)
+        if matched is None:
+            # same as `fnmatch.fnmatch`, which normalizes the case on Windows
+            matched = self.regex is not None and \
+                self.regex.match(os.path.normcase(name)) is not None
+            if len(self.cache) >= 4096:
+                self.cache.clear()
+            self.cache[name] = matched
+        return matched